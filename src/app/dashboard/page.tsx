@@ -2,27 +2,23 @@
 
 import { useState, useEffect } from 'react';
 import Link from 'next/link';
-import {
-  getProblemsCountByStatus,
-  getIdeasCountByStatus,
-  getRecentProblems,
-  getRecentIdeas,
-} from '@/lib/storage';
-import { Problem, Idea } from '@/lib/types';
+import { getDashboardData } from '@/lib/storage';
+import { ProblemSummary, IdeaSummary } from '@/lib/types';
 
 export default function Dashboard() {
   const [problemCounts, setProblemCounts] = useState<Record<string, number>>({});
   const [ideaCounts, setIdeaCounts] = useState<Record<string, number>>({});
-  const [recentProblems, setRecentProblems] = useState<Problem[]>([]);
-  const [recentIdeas, setRecentIdeas] = useState<Idea[]>([]);
+  const [recentProblems, setRecentProblems] = useState<ProblemSummary[]>([]);
+  const [recentIdeas, setRecentIdeas] = useState<IdeaSummary[]>([]);
   const [mounted, setMounted] = useState(false);
 
   useEffect(() => {
     setMounted(true);
-    setProblemCounts(getProblemsCountByStatus());
-    setIdeaCounts(getIdeasCountByStatus());
-    setRecentProblems(getRecentProblems(5));
-    setRecentIdeas(getRecentIdeas(5));
+    const dashboard = getDashboardData(5);
+    setProblemCounts(dashboard.problems);
+    setIdeaCounts(dashboard.ideas);
+    setRecentProblems(dashboard.recent_problems);
+    setRecentIdeas(dashboard.recent_ideas);
   }, []);
 
   if (!mounted) {
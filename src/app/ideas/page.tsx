@@ -1,18 +1,17 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useMemo } from 'react';
 import {
   getAllIdeas,
-  getIdeaById,
-  createIdea,
-  updateIdea,
+  queryIdeas,
+  getIdeaBundle,
   deleteIdea,
   getAllProblems,
-  getProblemsForIdea,
-  getNotesForIdea,
   getLinkedProblemIdsForIdea,
-  setProblemLinksForIdea,
+  saveIdeaWithLinks,
 } from '@/lib/storage';
+import { useDebouncedValue, usePagedList } from '@/lib/hooks';
+import LoadMore from '@/components/LoadMore';
 import { Idea, Problem, Note } from '@/lib/types';
 
 export default function Ideas() {
@@ -31,6 +30,12 @@ export default function Ideas() {
   const [filterStatus, setFilterStatus] = useState('All');
   const [filterTags, setFilterTags] = useState('');
   const [keyword, setKeyword] = useState('');
+  const debouncedTags = useDebouncedValue(filterTags);
+  const debouncedKeyword = useDebouncedValue(keyword);
+  const paged = usePagedList(
+    filteredIdeas,
+    JSON.stringify([filterStatus, debouncedTags, debouncedKeyword])
+  );
 
   // Form state
   const [form, setForm] = useState({
@@ -55,43 +60,36 @@ export default function Ideas() {
 
   useEffect(() => {
     applyFilters();
-  }, [ideas, filterStatus, filterTags, keyword]);
+  }, [ideas, filterStatus, debouncedTags, debouncedKeyword]);
 
   const loadData = () => {
     setIdeas(getAllIdeas());
+  };
+
+  // The problem checklist is only needed by the add/edit form, so load it
+  // when the form opens rather than on every list refresh
+  const openForm = () => {
     setAllProblems(getAllProblems());
+    setShowForm(true);
   };
 
   const applyFilters = () => {
-    let filtered = [...ideas];
-
-    if (filterStatus !== 'All') {
-      filtered = filtered.filter((i) => i.status === filterStatus);
-    }
-    if (filterTags) {
-      const tags = filterTags.toLowerCase().split(',').map((t) => t.trim());
-      filtered = filtered.filter(
-        (i) => i.tags && tags.some((t) => i.tags.toLowerCase().includes(t))
-      );
-    }
-    if (keyword) {
-      const kw = keyword.toLowerCase();
-      filtered = filtered.filter(
-        (i) =>
-          i.title.toLowerCase().includes(kw) ||
-          i.pitch.toLowerCase().includes(kw)
-      );
-    }
-
-    setFilteredIdeas(filtered);
+    setFilteredIdeas(
+      queryIdeas({
+        status:
+          filterStatus !== 'All' ? (filterStatus as Idea['status']) : undefined,
+        tags: debouncedTags || undefined,
+        keyword: debouncedKeyword || undefined,
+      })
+    );
   };
 
   const selectIdea = (id: number) => {
-    const idea = getIdeaById(id);
-    if (idea) {
-      setSelectedIdea(idea);
-      setLinkedProblems(getProblemsForIdea(id));
-      setLinkedNotes(getNotesForIdea(id));
+    const bundle = getIdeaBundle(id);
+    if (bundle) {
+      setSelectedIdea(bundle.idea);
+      setLinkedProblems(bundle.linked_problems);
+      setLinkedNotes(bundle.notes);
       setIsEditing(false);
       setShowForm(false);
     }
@@ -115,7 +113,7 @@ export default function Ideas() {
         linkedProblemIds: linkedIds,
       });
       setIsEditing(true);
-      setShowForm(true);
+      openForm();
     }
   };
 
@@ -136,9 +134,14 @@ export default function Ideas() {
       linkedProblemIds: [],
     });
     setIsEditing(false);
-    setShowForm(true);
+    openForm();
   };
 
+  const linkedProblemIdSet = useMemo(
+    () => new Set(form.linkedProblemIds),
+    [form.linkedProblemIds]
+  );
+
   const handleSubmit = (e: React.FormEvent) => {
     e.preventDefault();
     if (!form.title.trim()) {
@@ -148,36 +151,22 @@ export default function Ideas() {
 
     const finalScore = form.useScore ? (form.score ?? 50) : null;
 
-    if (isEditing && selectedIdea) {
-      updateIdea(
-        selectedIdea.id,
-        form.title.trim(),
-        form.pitch,
-        form.target_user,
-        form.value_prop,
-        form.differentiation,
-        form.assumptions,
-        form.risks,
-        form.status,
-        finalScore,
-        form.tags
-      );
-      setProblemLinksForIdea(selectedIdea.id, form.linkedProblemIds);
-    } else {
-      const id = createIdea(
-        form.title.trim(),
-        form.pitch,
-        form.target_user,
-        form.value_prop,
-        form.differentiation,
-        form.assumptions,
-        form.risks,
-        form.status,
-        finalScore,
-        form.tags
-      );
-      setProblemLinksForIdea(id, form.linkedProblemIds);
-    }
+    saveIdeaWithLinks(
+      isEditing && selectedIdea ? selectedIdea.id : null,
+      {
+        title: form.title.trim(),
+        pitch: form.pitch,
+        target_user: form.target_user,
+        value_prop: form.value_prop,
+        differentiation: form.differentiation,
+        assumptions: form.assumptions,
+        risks: form.risks,
+        status: form.status,
+        score: finalScore,
+        tags: form.tags,
+      },
+      form.linkedProblemIds
+    );
 
     loadData();
     setShowForm(false);
@@ -202,6 +191,34 @@ export default function Ideas() {
     }));
   };
 
+  const listRows = useMemo(
+    () =>
+      paged.visible.map((i) => (
+        <tr
+          key={i.id}
+          className={`border-b cursor-pointer hover:bg-gray-50 ${
+            selectedIdea?.id === i.id ? 'bg-blue-50' : ''
+          }`}
+          onClick={() => selectIdea(i.id)}
+        >
+          <td className="py-2 font-medium">{i.title}</td>
+          <td className="py-2 text-gray-500 text-sm">
+            {i.pitch.slice(0, 40)}
+            {i.pitch.length > 40 ? '...' : ''}
+          </td>
+          <td className="py-2">
+            <span className={`badge badge-${i.status}`}>
+              {i.status}
+            </span>
+          </td>
+          <td className="py-2 text-center">
+            {i.score !== null ? i.score : '-'}
+          </td>
+        </tr>
+      )),
+    [paged.visible, selectedIdea?.id]
+  );
+
   if (!mounted) {
     return (
       <div className="p-8">
@@ -277,31 +294,10 @@ export default function Ideas() {
                   </tr>
                 </thead>
                 <tbody>
-                  {filteredIdeas.map((i) => (
-                    <tr
-                      key={i.id}
-                      className={`border-b cursor-pointer hover:bg-gray-50 ${
-                        selectedIdea?.id === i.id ? 'bg-blue-50' : ''
-                      }`}
-                      onClick={() => selectIdea(i.id)}
-                    >
-                      <td className="py-2 font-medium">{i.title}</td>
-                      <td className="py-2 text-gray-500 text-sm">
-                        {i.pitch.slice(0, 40)}
-                        {i.pitch.length > 40 ? '...' : ''}
-                      </td>
-                      <td className="py-2">
-                        <span className={`badge badge-${i.status}`}>
-                          {i.status}
-                        </span>
-                      </td>
-                      <td className="py-2 text-center">
-                        {i.score !== null ? i.score : '-'}
-                      </td>
-                    </tr>
-                  ))}
+                  {listRows}
                 </tbody>
               </table>
+              <LoadMore remaining={paged.remaining} onClick={paged.showMore} />
             </div>
           ) : (
             <div className="card text-center text-gray-500">
@@ -453,7 +449,7 @@ export default function Ideas() {
                         >
                           <input
                             type="checkbox"
-                            checked={form.linkedProblemIds.includes(p.id)}
+                            checked={linkedProblemIdSet.has(p.id)}
                             onChange={() => toggleProblemLink(p.id)}
                           />
                           <span className="text-sm">{p.title}</span>
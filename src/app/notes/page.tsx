@@ -1,17 +1,18 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useMemo } from 'react';
 import {
   getAllNotes,
+  queryNotes,
   getNoteById,
   createNote,
   updateNote,
   deleteNote,
   getAllProblems,
   getAllIdeas,
-  getProblemById,
-  getIdeaById,
 } from '@/lib/storage';
+import { usePagedList } from '@/lib/hooks';
+import LoadMore from '@/components/LoadMore';
 import { Note, Problem, Idea } from '@/lib/types';
 
 export default function Notes() {
@@ -29,6 +30,10 @@ export default function Notes() {
   const [filterType, setFilterType] = useState('All');
   const [filterProblem, setFilterProblem] = useState<number | null>(null);
   const [filterIdea, setFilterIdea] = useState<number | null>(null);
+  const paged = usePagedList(
+    filteredNotes,
+    JSON.stringify([filterType, filterProblem, filterIdea])
+  );
 
   // Form state
   const [form, setForm] = useState({
@@ -55,19 +60,14 @@ export default function Notes() {
   };
 
   const applyFilters = () => {
-    let filtered = [...notes];
-
-    if (filterType !== 'All') {
-      filtered = filtered.filter((n) => n.note_type === filterType);
-    }
-    if (filterProblem !== null) {
-      filtered = filtered.filter((n) => n.problem_id === filterProblem);
-    }
-    if (filterIdea !== null) {
-      filtered = filtered.filter((n) => n.idea_id === filterIdea);
-    }
-
-    setFilteredNotes(filtered);
+    setFilteredNotes(
+      queryNotes({
+        note_type:
+          filterType !== 'All' ? (filterType as Note['note_type']) : undefined,
+        problem_id: filterProblem ?? undefined,
+        idea_id: filterIdea ?? undefined,
+      })
+    );
   };
 
   const selectNote = (id: number) => {
@@ -146,18 +146,80 @@ export default function Notes() {
     }
   };
 
+  // Titles keyed by id, built once per list load from the problems and ideas
+  // already fetched for the filter dropdowns
+  const problemTitles = useMemo(
+    () => new Map(allProblems.map((p) => [p.id, p.title] as [number, string])),
+    [allProblems]
+  );
+  const ideaTitles = useMemo(
+    () => new Map(allIdeas.map((i) => [i.id, i.title] as [number, string])),
+    [allIdeas]
+  );
+
+  // Select options shared by the filter bar and the form, built once per load
+  const problemOptions = useMemo(
+    () =>
+      allProblems.map((p) => (
+        <option key={p.id} value={p.id}>
+          {p.title.slice(0, 30)}
+        </option>
+      )),
+    [allProblems]
+  );
+  const ideaOptions = useMemo(
+    () =>
+      allIdeas.map((i) => (
+        <option key={i.id} value={i.id}>
+          {i.title.slice(0, 30)}
+        </option>
+      )),
+    [allIdeas]
+  );
+
   const getProblemName = (id: number | null) => {
     if (!id) return '-';
-    const p = getProblemById(id);
-    return p ? p.title : '-';
+    return problemTitles.get(id) ?? '-';
   };
 
   const getIdeaName = (id: number | null) => {
     if (!id) return '-';
-    const i = getIdeaById(id);
-    return i ? i.title : '-';
+    return ideaTitles.get(id) ?? '-';
   };
 
+  const listRows = useMemo(
+    () =>
+      paged.visible.map((n) => (
+        <tr
+          key={n.id}
+          className={`border-b cursor-pointer hover:bg-gray-50 ${
+            selectedNote?.id === n.id ? 'bg-blue-50' : ''
+          }`}
+          onClick={() => selectNote(n.id)}
+        >
+          <td className="py-2">
+            <span className="badge bg-gray-100 text-gray-800">
+              {n.note_type}
+            </span>
+          </td>
+          <td className="py-2 text-sm">
+            {n.content.slice(0, 50)}
+            {n.content.length > 50 ? '...' : ''}
+          </td>
+          <td className="py-2 text-sm text-gray-500">
+            {getProblemName(n.problem_id).slice(0, 20)}
+          </td>
+          <td className="py-2 text-sm text-gray-500">
+            {getIdeaName(n.idea_id).slice(0, 20)}
+          </td>
+          <td className="py-2 text-sm text-gray-500">
+            {new Date(n.created_at).toLocaleDateString()}
+          </td>
+        </tr>
+      )),
+    [paged.visible, selectedNote?.id, problemTitles, ideaTitles]
+  );
+
   if (!mounted) {
     return (
       <div className="p-8">
@@ -209,11 +271,7 @@ export default function Notes() {
                   }
                 >
                   <option value="">All</option>
-                  {allProblems.map((p) => (
-                    <option key={p.id} value={p.id}>
-                      {p.title.slice(0, 30)}
-                    </option>
-                  ))}
+                  {problemOptions}
                 </select>
               </div>
               <div>
@@ -226,11 +284,7 @@ export default function Notes() {
                   }
                 >
                   <option value="">All</option>
-                  {allIdeas.map((i) => (
-                    <option key={i.id} value={i.id}>
-                      {i.title.slice(0, 30)}
-                    </option>
-                  ))}
+                  {ideaOptions}
                 </select>
               </div>
             </div>
@@ -250,36 +304,10 @@ export default function Notes() {
                   </tr>
                 </thead>
                 <tbody>
-                  {filteredNotes.map((n) => (
-                    <tr
-                      key={n.id}
-                      className={`border-b cursor-pointer hover:bg-gray-50 ${
-                        selectedNote?.id === n.id ? 'bg-blue-50' : ''
-                      }`}
-                      onClick={() => selectNote(n.id)}
-                    >
-                      <td className="py-2">
-                        <span className="badge bg-gray-100 text-gray-800">
-                          {n.note_type}
-                        </span>
-                      </td>
-                      <td className="py-2 text-sm">
-                        {n.content.slice(0, 50)}
-                        {n.content.length > 50 ? '...' : ''}
-                      </td>
-                      <td className="py-2 text-sm text-gray-500">
-                        {getProblemName(n.problem_id).slice(0, 20)}
-                      </td>
-                      <td className="py-2 text-sm text-gray-500">
-                        {getIdeaName(n.idea_id).slice(0, 20)}
-                      </td>
-                      <td className="py-2 text-sm text-gray-500">
-                        {new Date(n.created_at).toLocaleDateString()}
-                      </td>
-                    </tr>
-                  ))}
+                  {listRows}
                 </tbody>
               </table>
+              <LoadMore remaining={paged.remaining} onClick={paged.showMore} />
             </div>
           ) : (
             <div className="card text-center text-gray-500">
@@ -351,11 +379,7 @@ export default function Notes() {
                       }
                     >
                       <option value="">None</option>
-                      {allProblems.map((p) => (
-                        <option key={p.id} value={p.id}>
-                          {p.title.slice(0, 30)}
-                        </option>
-                      ))}
+                      {problemOptions}
                     </select>
                   </div>
                   <div>
@@ -373,11 +397,7 @@ export default function Notes() {
                       }
                     >
                       <option value="">None</option>
-                      {allIdeas.map((i) => (
-                        <option key={i.id} value={i.id}>
-                          {i.title.slice(0, 30)}
-                        </option>
-                      ))}
+                      {ideaOptions}
                     </select>
                   </div>
                 </div>
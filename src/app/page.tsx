@@ -3,9 +3,7 @@
 import { useState, useEffect } from 'react';
 import Link from 'next/link';
 import {
-  getProblemsCountByStatus,
-  getIdeasCountByStatus,
-  getAllNotes,
+  getDashboardStats,
   exportAllData,
   importAllData,
   clearAllData,
@@ -17,7 +15,6 @@ export default function Home() {
     ideas: 0,
     notes: 0,
   });
-  const [confirmClear, setConfirmClear] = useState('');
   const [mounted, setMounted] = useState(false);
 
   useEffect(() => {
@@ -26,14 +23,12 @@ export default function Home() {
   }, []);
 
   const loadStats = () => {
-    const problemCounts = getProblemsCountByStatus();
-    const ideaCounts = getIdeasCountByStatus();
-    const notes = getAllNotes();
+    const dashboard = getDashboardStats();
 
     setStats({
-      problems: Object.values(problemCounts).reduce((a, b) => a + b, 0),
-      ideas: Object.values(ideaCounts).reduce((a, b) => a + b, 0),
-      notes: notes.length,
+      problems: Object.values(dashboard.problems).reduce((a, b) => a + b, 0),
+      ideas: Object.values(dashboard.ideas).reduce((a, b) => a + b, 0),
+      notes: dashboard.notes_total,
     });
   };
 
@@ -71,15 +66,6 @@ export default function Home() {
     reader.readAsText(file);
   };
 
-  const handleClear = () => {
-    if (confirmClear === 'DELETE') {
-      clearAllData();
-      setConfirmClear('');
-      loadStats();
-      alert('All data cleared.');
-    }
-  };
-
   if (!mounted) {
     return (
       <div className="p-8">
@@ -200,29 +186,48 @@ export default function Home() {
       </div>
 
       {/* Danger Zone */}
-      <div className="card border-red-200 bg-red-50">
-        <h4 className="font-semibold text-red-800 mb-4">
-          Danger Zone - Clear All Data
-        </h4>
-        <p className="text-sm text-red-600 mb-4">
-          This will permanently delete all your problems, ideas, notes, and links.
-        </p>
-        <div className="flex gap-4 items-center">
-          <input
-            type="text"
-            placeholder="Type DELETE to confirm"
-            value={confirmClear}
-            onChange={(e) => setConfirmClear(e.target.value)}
-            className="input max-w-xs"
-          />
-          <button
-            onClick={handleClear}
-            disabled={confirmClear !== 'DELETE'}
-            className="btn btn-danger disabled:opacity-50 disabled:cursor-not-allowed"
-          >
-            Clear All Data
-          </button>
-        </div>
+      <ClearDataCard onCleared={loadStats} />
+    </div>
+  );
+}
+
+// Kept in its own component so typing the confirmation only re-renders this
+// card, not the whole home page.
+function ClearDataCard({ onCleared }: { onCleared: () => void }) {
+  const [confirmClear, setConfirmClear] = useState('');
+
+  const handleClear = () => {
+    if (confirmClear === 'DELETE') {
+      clearAllData();
+      setConfirmClear('');
+      onCleared();
+      alert('All data cleared.');
+    }
+  };
+
+  return (
+    <div className="card border-red-200 bg-red-50">
+      <h4 className="font-semibold text-red-800 mb-4">
+        Danger Zone - Clear All Data
+      </h4>
+      <p className="text-sm text-red-600 mb-4">
+        This will permanently delete all your problems, ideas, notes, and links.
+      </p>
+      <div className="flex gap-4 items-center">
+        <input
+          type="text"
+          placeholder="Type DELETE to confirm"
+          value={confirmClear}
+          onChange={(e) => setConfirmClear(e.target.value)}
+          className="input max-w-xs"
+        />
+        <button
+          onClick={handleClear}
+          disabled={confirmClear !== 'DELETE'}
+          className="btn btn-danger disabled:opacity-50 disabled:cursor-not-allowed"
+        >
+          Clear All Data
+        </button>
       </div>
     </div>
   );
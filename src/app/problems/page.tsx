@@ -1,15 +1,16 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useMemo } from 'react';
 import {
   getAllProblems,
-  getProblemById,
+  getProblemBundle,
   createProblem,
   updateProblem,
   deleteProblem,
-  getIdeasForProblem,
-  getNotesForProblem,
+  queryProblems,
 } from '@/lib/storage';
+import { useDebouncedValue, usePagedList } from '@/lib/hooks';
+import LoadMore from '@/components/LoadMore';
 import { Problem, Idea, Note } from '@/lib/types';
 
 export default function Problems() {
@@ -28,6 +29,12 @@ export default function Problems() {
   const [filterSeverity, setFilterSeverity] = useState('All');
   const [filterTags, setFilterTags] = useState('');
   const [keyword, setKeyword] = useState('');
+  const debouncedTags = useDebouncedValue(filterTags);
+  const debouncedKeyword = useDebouncedValue(keyword);
+  const paged = usePagedList(
+    filteredProblems,
+    JSON.stringify([filterStatus, filterSeverity, debouncedTags, debouncedKeyword])
+  );
 
   // Form state
   const [form, setForm] = useState({
@@ -47,45 +54,32 @@ export default function Problems() {
 
   useEffect(() => {
     applyFilters();
-  }, [problems, filterStatus, filterSeverity, filterTags, keyword]);
+  }, [problems, filterStatus, filterSeverity, debouncedTags, debouncedKeyword]);
 
   const loadProblems = () => {
     setProblems(getAllProblems());
   };
 
   const applyFilters = () => {
-    let filtered = [...problems];
-
-    if (filterStatus !== 'All') {
-      filtered = filtered.filter((p) => p.status === filterStatus);
-    }
-    if (filterSeverity !== 'All') {
-      filtered = filtered.filter((p) => p.severity === Number(filterSeverity));
-    }
-    if (filterTags) {
-      const tags = filterTags.toLowerCase().split(',').map((t) => t.trim());
-      filtered = filtered.filter(
-        (p) => p.tags && tags.some((t) => p.tags.toLowerCase().includes(t))
-      );
-    }
-    if (keyword) {
-      const kw = keyword.toLowerCase();
-      filtered = filtered.filter(
-        (p) =>
-          p.title.toLowerCase().includes(kw) ||
-          p.description.toLowerCase().includes(kw)
-      );
-    }
-
-    setFilteredProblems(filtered);
+    setFilteredProblems(
+      queryProblems({
+        status:
+          filterStatus !== 'All'
+            ? (filterStatus as Problem['status'])
+            : undefined,
+        severity: filterSeverity !== 'All' ? Number(filterSeverity) : undefined,
+        tags: debouncedTags || undefined,
+        keyword: debouncedKeyword || undefined,
+      })
+    );
   };
 
   const selectProblem = (id: number) => {
-    const problem = getProblemById(id);
-    if (problem) {
-      setSelectedProblem(problem);
-      setLinkedIdeas(getIdeasForProblem(id));
-      setLinkedNotes(getNotesForProblem(id));
+    const bundle = getProblemBundle(id);
+    if (bundle) {
+      setSelectedProblem(bundle.problem);
+      setLinkedIdeas(bundle.linked_ideas);
+      setLinkedNotes(bundle.notes);
       setIsEditing(false);
       setShowForm(false);
     }
@@ -166,6 +160,32 @@ export default function Problems() {
     }
   };
 
+  const listRows = useMemo(
+    () =>
+      paged.visible.map((p) => (
+        <tr
+          key={p.id}
+          className={`border-b cursor-pointer hover:bg-gray-50 ${
+            selectedProblem?.id === p.id ? 'bg-blue-50' : ''
+          }`}
+          onClick={() => selectProblem(p.id)}
+        >
+          <td className="py-2 font-medium">{p.title}</td>
+          <td className="py-2">
+            <span className={`badge badge-${p.status}`}>
+              {p.status}
+            </span>
+          </td>
+          <td className="py-2 text-center">{p.severity}/5</td>
+          <td className="py-2">{p.frequency}</td>
+          <td className="py-2 text-gray-500 text-sm">
+            {p.tags || '-'}
+          </td>
+        </tr>
+      )),
+    [paged.visible, selectedProblem?.id]
+  );
+
   if (!mounted) {
     return (
       <div className="p-8">
@@ -255,29 +275,10 @@ export default function Problems() {
                   </tr>
                 </thead>
                 <tbody>
-                  {filteredProblems.map((p) => (
-                    <tr
-                      key={p.id}
-                      className={`border-b cursor-pointer hover:bg-gray-50 ${
-                        selectedProblem?.id === p.id ? 'bg-blue-50' : ''
-                      }`}
-                      onClick={() => selectProblem(p.id)}
-                    >
-                      <td className="py-2 font-medium">{p.title}</td>
-                      <td className="py-2">
-                        <span className={`badge badge-${p.status}`}>
-                          {p.status}
-                        </span>
-                      </td>
-                      <td className="py-2 text-center">{p.severity}/5</td>
-                      <td className="py-2">{p.frequency}</td>
-                      <td className="py-2 text-gray-500 text-sm">
-                        {p.tags || '-'}
-                      </td>
-                    </tr>
-                  ))}
+                  {listRows}
                 </tbody>
               </table>
+              <LoadMore remaining={paged.remaining} onClick={paged.showMore} />
             </div>
           ) : (
             <div className="card text-center text-gray-500">
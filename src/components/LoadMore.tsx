@@ -0,0 +1,17 @@
+// "Load more" footer for lists windowed with usePagedList
+export default function LoadMore({
+  remaining,
+  onClick,
+}: {
+  remaining: number;
+  onClick: () => void;
+}) {
+  if (remaining <= 0) return null;
+  return (
+    <div className="text-center mt-4">
+      <button onClick={onClick} className="btn btn-secondary">
+        Load more ({remaining} remaining)
+      </button>
+    </div>
+  );
+}
@@ -0,0 +1,42 @@
+import { useEffect, useMemo, useState } from 'react';
+
+// Rows rendered per "Load more" step
+export const PAGE_SIZE = 50;
+
+// `value`, but only after it has stopped changing for `delay` ms. Lets text
+// filters re-query once per pause in typing instead of on every keystroke.
+export function useDebouncedValue<T>(value: T, delay = 250): T {
+  const [debounced, setDebounced] = useState(value);
+
+  useEffect(() => {
+    const timer = setTimeout(() => setDebounced(value), delay);
+    return () => clearTimeout(timer);
+  }, [value, delay]);
+
+  return debounced;
+}
+
+// Windows a list to its first PAGE_SIZE rows, growing a page per showMore().
+// The window snaps back to one page only when `resetKey` (built from the
+// filter inputs) changes, so saving or deleting a row keeps what's loaded.
+// `visible` keeps its identity until the list or the window changes, so pages
+// can memoize their table rows on it: typing in a form or opening a delete
+// confirmation then doesn't rebuild every row.
+export function usePagedList<T>(items: T[], resetKey: string) {
+  const [visibleCount, setVisibleCount] = useState(PAGE_SIZE);
+
+  useEffect(() => {
+    setVisibleCount(PAGE_SIZE);
+  }, [resetKey]);
+
+  const visible = useMemo(
+    () => items.slice(0, visibleCount),
+    [items, visibleCount]
+  );
+
+  return {
+    visible,
+    remaining: Math.max(items.length - visibleCount, 0),
+    showMore: () => setVisibleCount((count) => count + PAGE_SIZE),
+  };
+}
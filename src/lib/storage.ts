@@ -1,36 +1,240 @@
-import { Problem, Idea, Note, ProblemIdeaLink, StorageData } from './types';
+import {
+  Problem,
+  ProblemInput,
+  ProblemFilters,
+  ProblemSummary,
+  ProblemBundle,
+  Idea,
+  IdeaInput,
+  IdeaFilters,
+  IdeaBundle,
+  IdeaSummary,
+  Note,
+  NoteInput,
+  NoteFilters,
+  ProblemIdeaLink,
+  StorageData,
+  DashboardStats,
+  DashboardData
+} from './types';
+
+type Section = keyof StorageData;
+
+// Each collection lives under its own key, so a write only re-serializes the
+// sections it touched rather than the whole vault.
+const STORAGE_KEYS: Record<Section, string> = {
+  problems: 'ideavault_problems',
+  ideas: 'ideavault_ideas',
+  notes: 'ideavault_notes',
+  links: 'ideavault_links',
+  counters: 'ideavault_counters'
+};
+
+const SECTIONS = Object.keys(STORAGE_KEYS) as Section[];
+
+// Single-blob layout used before the per-collection split
+const LEGACY_STORAGE_KEY = 'ideavault_data';
+
+// Parsed vault shared by every read for the lifetime of the page, so a page
+// that calls several getters touches localStorage once instead of per call.
+let cachedData: StorageData | null = null;
+
+// Values derived from the stored data (status counts, etc), each tagged with
+// the sections it was computed from. A write drops only the values that read
+// a section it touched, so e.g. adding a note keeps the problem indexes.
+const derivedCache = new Map<string, unknown>();
+const derivedDeps = new Map<string, Section[]>();
+
+function memoize<T>(key: string, sections: Section[], compute: () => T): T {
+  if (!derivedCache.has(key)) {
+    derivedCache.set(key, compute());
+    derivedDeps.set(key, sections);
+  }
+  return derivedCache.get(key) as T;
+}
+
+function invalidateCaches(sections: Section[] = SECTIONS): void {
+  derivedDeps.forEach((deps, key) => {
+    if (deps.some(section => sections.indexOf(section) !== -1)) {
+      derivedCache.delete(key);
+      derivedDeps.delete(key);
+    }
+  });
+}
+
+if (typeof window !== 'undefined') {
+  // Another tab wrote to the vault; drop our copy and anything derived from it.
+  window.addEventListener('storage', (e) => {
+    if (e.key === null || SECTIONS.some(section => STORAGE_KEYS[section] === e.key)) {
+      cachedData = null;
+      invalidateCaches();
+    }
+  });
+}
+
+function emptyData(): StorageData {
+  return {
+    problems: [],
+    ideas: [],
+    notes: [],
+    links: [],
+    counters: { problems: 0, ideas: 0, notes: 0, links: 0 }
+  };
+}
+
+// Writes the sections all-or-nothing: everything is serialized before the
+// first setItem, and if a later write fails (quota) the sections already
+// written are put back, so a large import can't leave a half-replaced vault.
+// Sections whose serialized form matches what's stored are skipped, so e.g.
+// re-importing the current backup doesn't rewrite anything. A single-section
+// write has nothing to roll back and skips reading what's stored.
+function writeSections(data: StorageData, sections: Section[]): void {
+  if (sections.length === 1) {
+    localStorage.setItem(STORAGE_KEYS[sections[0]], JSON.stringify(data[sections[0]]));
+    return;
+  }
+  const serialized = sections.map(section => JSON.stringify(data[section]));
+  const previous = sections.map(section => localStorage.getItem(STORAGE_KEYS[section]));
+  const written: number[] = [];
+  try {
+    sections.forEach((section, i) => {
+      if (serialized[i] === previous[i]) return;
+      localStorage.setItem(STORAGE_KEYS[section], serialized[i]);
+      written.push(i);
+    });
+  } catch (e) {
+    written.forEach(i => {
+      const key = STORAGE_KEYS[sections[i]];
+      if (previous[i] === null) {
+        localStorage.removeItem(key);
+      } else {
+        localStorage.setItem(key, previous[i] as string);
+      }
+    });
+    throw e;
+  }
+}
+
+// Set while a pre-split vault is being served from memory because moving it
+// to the per-collection keys failed; the next save retries the move.
+let legacyMigrationPending = false;
+
+// Replace the legacy blob with the per-collection keys. The blob is removed
+// first so storage never has to hold two copies of the vault, and put back if
+// the sections don't fit.
+function migrateLegacy(data: StorageData, legacy: string): void {
+  localStorage.removeItem(LEGACY_STORAGE_KEY);
+  try {
+    writeSections(data, SECTIONS);
+  } catch (e) {
+    localStorage.setItem(LEGACY_STORAGE_KEY, legacy);
+    throw e;
+  }
+  legacyMigrationPending = false;
+}
+
+function loadStorageData(): StorageData {
+  const stored = SECTIONS.map(section => localStorage.getItem(STORAGE_KEYS[section]));
+
+  // Only a browser with none of the per-collection keys can still hold a
+  // pre-split vault, so up-to-date vaults never probe the legacy key.
+  if (stored.every(raw => raw === null)) {
+    const legacy = localStorage.getItem(LEGACY_STORAGE_KEY);
+    if (legacy) {
+      const migrated = { ...emptyData(), ...(JSON.parse(legacy) as StorageData) };
+      try {
+        migrateLegacy(migrated, legacy);
+      } catch {
+        // Keep serving the vault from memory rather than failing every read
+        legacyMigrationPending = true;
+      }
+      return migrated;
+    }
+  }
 
-const STORAGE_KEY = 'ideavault_data';
+  // Missing sections stay empty; they are only persisted by the first real
+  // write, keeping reads free of localStorage writes.
+  const data = emptyData();
+  SECTIONS.forEach((section, i) => {
+    const raw = stored[i];
+    if (raw) data[section] = JSON.parse(raw);
+  });
+  return data;
+}
 
 function getStorageData(): StorageData {
   if (typeof window === 'undefined') {
-    return {
-      problems: [],
-      ideas: [],
-      notes: [],
-      links: [],
-      counters: { problems: 0, ideas: 0, notes: 0, links: 0 }
-    };
+    return emptyData();
   }
-
-  const stored = localStorage.getItem(STORAGE_KEY);
-  if (!stored) {
-    const initial: StorageData = {
-      problems: [],
-      ideas: [],
-      notes: [],
-      links: [],
-      counters: { problems: 0, ideas: 0, notes: 0, links: 0 }
-    };
-    localStorage.setItem(STORAGE_KEY, JSON.stringify(initial));
-    return initial;
+  if (!cachedData) {
+    cachedData = loadStorageData();
   }
-  return JSON.parse(stored);
+  return cachedData;
 }
 
-function saveStorageData(data: StorageData): void {
+// While inside batch(), saves only update the in-memory copy and collect the
+// touched sections; the outermost batch() writes them once on exit.
+let batchDepth = 0;
+const batchDirty = new Set<Section>();
+
+function saveStorageData(data: StorageData, sections: Section[]): void {
   if (typeof window === 'undefined') return;
-  localStorage.setItem(STORAGE_KEY, JSON.stringify(data));
+  if (batchDepth > 0) {
+    cachedData = data;
+    invalidateCaches(sections);
+    sections.forEach(section => batchDirty.add(section));
+    return;
+  }
+  // Drop the cache first: if setItem throws (quota), the next read must
+  // re-parse what's actually stored rather than our mutated copy, and nothing
+  // derived from the discarded copy may survive.
+  cachedData = null;
+  invalidateCaches(sections);
+  try {
+    const legacy = legacyMigrationPending
+      ? localStorage.getItem(LEGACY_STORAGE_KEY)
+      : null;
+    if (legacy !== null) {
+      // A partial write would hide the rest of the legacy vault on reload, so
+      // finish the whole migration instead
+      migrateLegacy(data, legacy);
+    } else {
+      legacyMigrationPending = false;
+      writeSections(data, sections);
+    }
+  } catch (e) {
+    invalidateCaches();
+    throw e;
+  }
+  cachedData = data;
+}
+
+// Run several mutations with a single localStorage write per touched section.
+// If the outermost batch's fn throws, nothing is written and the in-memory
+// copy is re-read from storage, so it leaves no partial changes behind. A
+// nested batch doesn't roll back on its own: if an outer fn catches its
+// error, the outer batch commits whatever the inner one had changed.
+export function batch<T>(fn: () => T): T {
+  batchDepth++;
+  let result: T;
+  try {
+    result = fn();
+  } catch (e) {
+    batchDepth--;
+    if (batchDepth === 0) {
+      batchDirty.clear();
+      cachedData = null;
+      invalidateCaches();
+    }
+    throw e;
+  }
+  batchDepth--;
+  if (batchDepth === 0 && batchDirty.size > 0) {
+    const sections = SECTIONS.filter(section => batchDirty.has(section));
+    batchDirty.clear();
+    saveStorageData(getStorageData(), sections);
+  }
+  return result;
 }
 
 function getNextId(data: StorageData, type: keyof StorageData['counters']): number {
@@ -38,6 +242,235 @@ function getNextId(data: StorageData, type: keyof StorageData['counters']): numb
   return data.counters[type];
 }
 
+// Timestamps are ISO-8601 strings, which sort chronologically as plain strings;
+// comparing them directly avoids allocating two Dates per comparison.
+function byCreatedAtDesc(a: { created_at: string }, b: { created_at: string }): number {
+  if (a.created_at === b.created_at) return 0;
+  return a.created_at < b.created_at ? 1 : -1;
+}
+
+// Records are appended as they're created, so stored arrays are normally
+// already oldest-first. Check that in one pass and reverse instead of paying
+// for a full sort; anything out of order falls back to sorting. Runs of equal
+// timestamps (bulk creates) keep their stored order, as the stable sort would.
+// The getAll* getters memoize the result, so callers copy before mutating.
+function newestFirst<T extends { created_at: string }>(items: T[]): T[] {
+  for (let i = 1; i < items.length; i++) {
+    if (items[i].created_at < items[i - 1].created_at) {
+      return [...items].sort(byCreatedAtDesc);
+    }
+  }
+  const result: T[] = [];
+  let end = items.length;
+  while (end > 0) {
+    let start = end - 1;
+    while (start > 0 && items[start - 1].created_at === items[end - 1].created_at) {
+      start--;
+    }
+    for (let i = start; i < end; i++) result.push(items[i]);
+    end = start;
+  }
+  return result;
+}
+
+// The one place record timestamps come from, so created_at/updated_at always
+// share the ISO-8601 format byCreatedAtDesc relies on.
+function timestamp(): string {
+  return new Date().toISOString();
+}
+
+// Apply `changes` to a record and refresh its updated_at. Every update goes
+// through here, so the timestamp can't be forgotten.
+function touch<T extends { updated_at: string }>(record: T, changes: Partial<T>): T {
+  return { ...record, ...changes, updated_at: timestamp() };
+}
+
+// Whether applying `changes` would alter any field of `record`. Updates check
+// this before touch(), so re-saving an unchanged form neither bumps
+// updated_at nor rewrites storage.
+function hasChanges<T>(record: T, changes: Partial<T>): boolean {
+  return (Object.keys(changes) as (keyof T)[]).some(k => record[k] !== changes[k]);
+}
+
+// Reserve `count` consecutive ids in one counter bump.
+function allocateIds(
+  data: StorageData,
+  type: keyof StorageData['counters'],
+  count: number
+): number[] {
+  const first = data.counters[type] + 1;
+  data.counters[type] += count;
+  return Array.from({ length: count }, (_, i) => first + i);
+}
+
+// =============================================================================
+// INDEXES
+// =============================================================================
+// Lookup maps over the foreign-key columns, built lazily and rebuilt after the
+// next write. They replace full scans of notes/links on every detail view.
+
+function groupBy<T, K, V>(
+  items: T[],
+  key: (item: T) => K | null,
+  value: (item: T) => V
+): Map<K, V[]> {
+  const groups = new Map<K, V[]>();
+  items.forEach(item => {
+    const k = key(item);
+    if (k === null) return;
+    const group = groups.get(k);
+    if (group) {
+      group.push(value(item));
+    } else {
+      groups.set(k, [value(item)]);
+    }
+  });
+  return groups;
+}
+
+function indexById<T extends { id: number }>(items: T[]): Map<number, T> {
+  return new Map(items.map(item => [item.id, item] as [number, T]));
+}
+
+// Records by id, for detail views
+function getProblemsByIdIndex(): Map<number, Problem> {
+  return memoize('problemsById', ['problems'], () => indexById(getStorageData().problems));
+}
+
+function getIdeasByIdIndex(): Map<number, Idea> {
+  return memoize('ideasById', ['ideas'], () => indexById(getStorageData().ideas));
+}
+
+function getNotesByIdIndex(): Map<number, Note> {
+  return memoize('notesById', ['notes'], () => indexById(getStorageData().notes));
+}
+
+// Array slot of each record by id, so updates and deletes can go straight to
+// the record instead of scanning the stored list for it. Deletes splice at the
+// slot rather than swapping with the last record, keeping the stored arrays
+// in creation order for newestFirst.
+function indexPositions<T extends { id: number }>(items: T[]): Map<number, number> {
+  return new Map(items.map((item, i) => [item.id, i] as [number, number]));
+}
+
+function getProblemPositions(): Map<number, number> {
+  return memoize('problemPositions', ['problems'], () =>
+    indexPositions(getStorageData().problems)
+  );
+}
+
+function getIdeaPositions(): Map<number, number> {
+  return memoize('ideaPositions', ['ideas'], () => indexPositions(getStorageData().ideas));
+}
+
+function getNotePositions(): Map<number, number> {
+  return memoize('notePositions', ['notes'], () => indexPositions(getStorageData().notes));
+}
+
+// Problems per status, newest first
+function getProblemsByStatusIndex(): Map<Problem['status'], Problem[]> {
+  return memoize('problemsByStatus', ['problems'], () =>
+    groupBy(getAllProblems(), p => p.status, p => p)
+  );
+}
+
+// Comma-separated tags as a normalized list: trimmed, lowercased, no blanks
+function parseTags(tags: string): string[] {
+  return tags
+    .split(',')
+    .map(t => t.trim().toLowerCase())
+    .filter(t => t !== '');
+}
+
+// Records per normalized tag, keeping the input order: an inverted index, so
+// a tag filter is a lookup instead of a test against every row, and matches
+// whole tags ("ml" doesn't match "html")
+function groupByTag<T extends { tags: string }>(items: T[]): Map<string, T[]> {
+  const byTag = new Map<string, T[]>();
+  items.forEach(item => {
+    Array.from(new Set(parseTags(item.tags || ''))).forEach(tag => {
+      const group = byTag.get(tag);
+      if (group) {
+        group.push(item);
+      } else {
+        byTag.set(tag, [item]);
+      }
+    });
+  });
+  return byTag;
+}
+
+// Ids of the records carrying any of `tags`
+function idsWithAnyTag<T extends { id: number }>(
+  byTag: Map<string, T[]>,
+  tags: string[]
+): Set<number> {
+  const ids = new Set<number>();
+  tags.forEach(t => (byTag.get(t) || []).forEach(item => ids.add(item.id)));
+  return ids;
+}
+
+// Problems per normalized tag, newest first
+function getProblemsByTagIndex(): Map<string, Problem[]> {
+  return memoize('problemsByTag', ['problems'], () => groupByTag(getAllProblems()));
+}
+
+// Lowercased title + description per problem for keyword search, so typing
+// doesn't re-lowercase every row on each keystroke. The NUL separator keeps a
+// match from spanning the two fields.
+function getProblemSearchIndex(): Map<number, string> {
+  return memoize('problemSearchText', ['problems'], () =>
+    new Map(
+      getStorageData().problems.map(
+        p => [p.id, `${p.title}\u0000${p.description}`.toLowerCase()] as [number, string]
+      )
+    )
+  );
+}
+
+// Ideas per normalized tag, newest first
+function getIdeasByTagIndex(): Map<string, Idea[]> {
+  return memoize('ideasByTag', ['ideas'], () => groupByTag(getAllIdeas()));
+}
+
+// Lowercased title + pitch per idea for keyword search; see
+// getProblemSearchIndex
+function getIdeaSearchIndex(): Map<number, string> {
+  return memoize('ideaSearchText', ['ideas'], () =>
+    new Map(
+      getStorageData().ideas.map(
+        i => [i.id, `${i.title}\u0000${i.pitch}`.toLowerCase()] as [number, string]
+      )
+    )
+  );
+}
+
+// Notes per problem/idea, newest first
+function getNotesByProblemIndex(): Map<number, Note[]> {
+  return memoize('notesByProblem', ['notes'], () =>
+    groupBy(getAllNotes(), n => n.problem_id, n => n)
+  );
+}
+
+function getNotesByIdeaIndex(): Map<number, Note[]> {
+  return memoize('notesByIdea', ['notes'], () =>
+    groupBy(getAllNotes(), n => n.idea_id, n => n)
+  );
+}
+
+// Linked idea ids per problem, and problem ids per idea
+function getLinksByProblemIndex(): Map<number, number[]> {
+  return memoize('linksByProblem', ['links'], () =>
+    groupBy(getStorageData().links, l => l.problem_id, l => l.idea_id)
+  );
+}
+
+function getLinksByIdeaIndex(): Map<number, number[]> {
+  return memoize('linksByIdea', ['links'], () =>
+    groupBy(getStorageData().links, l => l.idea_id, l => l.problem_id)
+  );
+}
+
 // =============================================================================
 // PROBLEMS CRUD
 // =============================================================================
@@ -52,7 +485,7 @@ export function createProblem(
   tags = ''
 ): number {
   const data = getStorageData();
-  const now = new Date().toISOString();
+  const now = timestamp();
   const id = getNextId(data, 'problems');
 
   const problem: Problem = {
@@ -69,20 +502,55 @@ export function createProblem(
   };
 
   data.problems.push(problem);
-  saveStorageData(data);
+  saveStorageData(data, ['problems', 'counters']);
   return id;
 }
 
-export function getAllProblems(): Problem[] {
+export function createProblemsBulk(rows: ProblemInput[]): number[] {
+  if (rows.length === 0) return [];
+
   const data = getStorageData();
-  return [...data.problems].sort((a, b) =>
-    new Date(b.created_at).getTime() - new Date(a.created_at).getTime()
+  const now = timestamp();
+  const ids = allocateIds(data, 'problems', rows.length);
+
+  data.problems = data.problems.concat(
+    rows.map((row, i) => ({ ...row, id: ids[i], created_at: now, updated_at: now }))
+  );
+  saveStorageData(data, ['problems', 'counters']);
+  return ids;
+}
+
+export function getAllProblems(): Problem[] {
+  return memoize('allProblems', ['problems'], () =>
+    newestFirst(getStorageData().problems)
+  );
+}
+
+// Apply every list filter in a single pass over the problems
+export function queryProblems(filters: ProblemFilters = {}): Problem[] {
+  const { status, severity } = filters;
+  const tags = filters.tags ? parseTags(filters.tags) : [];
+  const keyword = filters.keyword ? filters.keyword.toLowerCase() : null;
+
+  // Start from the status group, or else a single tag's posting list
+  const byTag = tags.length > 0 ? getProblemsByTagIndex() : null;
+  const tagged = byTag ? idsWithAnyTag(byTag, tags) : null;
+  const candidates = status
+    ? getProblemsByStatusIndex().get(status) || []
+    : byTag && tags.length === 1
+      ? byTag.get(tags[0]) || []
+      : getAllProblems();
+  const searchText = keyword ? getProblemSearchIndex() : null;
+
+  return candidates.filter(p =>
+    (severity === undefined || p.severity === severity) &&
+    (!tagged || tagged.has(p.id)) &&
+    (!keyword || (searchText?.get(p.id) || '').includes(keyword))
   );
 }
 
 export function getProblemById(id: number): Problem | null {
-  const data = getStorageData();
-  return data.problems.find(p => p.id === id) || null;
+  return getProblemsByIdIndex().get(id) || null;
 }
 
 export function updateProblem(
@@ -96,55 +564,73 @@ export function updateProblem(
   tags: string
 ): boolean {
   const data = getStorageData();
-  const index = data.problems.findIndex(p => p.id === id);
+  const index = getProblemPositions().get(id);
 
-  if (index === -1) return false;
+  if (index === undefined) return false;
 
-  data.problems[index] = {
-    ...data.problems[index],
+  const changes = {
     title,
     description,
     observed_context,
     severity,
     frequency,
     status,
-    tags,
-    updated_at: new Date().toISOString()
+    tags
   };
+  if (!hasChanges(data.problems[index], changes)) return true;
+
+  data.problems[index] = touch(data.problems[index], changes);
 
-  saveStorageData(data);
+  saveStorageData(data, ['problems']);
   return true;
 }
 
 export function deleteProblem(id: number): boolean {
-  const data = getStorageData();
-  const originalLen = data.problems.length;
-  data.problems = data.problems.filter(p => p.id !== id);
+  const index = getProblemPositions().get(id);
+  if (index === undefined) return false;
 
-  if (data.problems.length < originalLen) {
+  // Only rewrite links/notes when something actually references the record
+  const hasLinks = getLinksByProblemIndex().has(id);
+  const notes = getNotesByProblemIndex().get(id) || [];
+  const notePositions = getNotePositions();
+
+  const data = getStorageData();
+  data.problems.splice(index, 1);
+  const sections: Section[] = ['problems'];
+  if (hasLinks) {
     // Cascade delete links
     data.links = data.links.filter(l => l.problem_id !== id);
+    sections.push('links');
+  }
+  if (notes.length > 0) {
     // Nullify note references
-    data.notes = data.notes.map(n =>
-      n.problem_id === id ? { ...n, problem_id: null } : n
-    );
-    saveStorageData(data);
-    return true;
+    notes.forEach(n => {
+      data.notes[notePositions.get(n.id) as number] = { ...n, problem_id: null };
+    });
+    sections.push('notes');
   }
-  return false;
+  saveStorageData(data, sections);
+  return true;
 }
 
 export function getProblemsCountByStatus(): Record<string, number> {
-  const data = getStorageData();
-  const counts: Record<string, number> = {};
-  data.problems.forEach(p => {
-    counts[p.status] = (counts[p.status] || 0) + 1;
+  const counts = memoize('problemCounts', ['problems'], () => {
+    const data = getStorageData();
+    const result: Record<string, number> = {};
+    data.problems.forEach(p => {
+      result[p.status] = (result[p.status] || 0) + 1;
+    });
+    return result;
   });
-  return counts;
+  return { ...counts };
 }
 
-export function getRecentProblems(limit = 5): Problem[] {
-  return getAllProblems().slice(0, limit);
+export function getRecentProblems(limit = 5): ProblemSummary[] {
+  return getAllProblems()
+    .slice(0, limit)
+    .map(({ id, title, status, severity, created_at }) => ({
+      id, title, status, severity, created_at
+    }));
 }
 
 // =============================================================================
@@ -164,7 +650,7 @@ export function createIdea(
   tags = ''
 ): number {
   const data = getStorageData();
-  const now = new Date().toISOString();
+  const now = timestamp();
   const id = getNextId(data, 'ideas');
 
   const idea: Idea = {
@@ -184,20 +670,53 @@ export function createIdea(
   };
 
   data.ideas.push(idea);
-  saveStorageData(data);
+  saveStorageData(data, ['ideas', 'counters']);
   return id;
 }
 
-export function getAllIdeas(): Idea[] {
+export function createIdeasBulk(rows: IdeaInput[]): number[] {
+  if (rows.length === 0) return [];
+
   const data = getStorageData();
-  return [...data.ideas].sort((a, b) =>
-    new Date(b.created_at).getTime() - new Date(a.created_at).getTime()
+  const now = timestamp();
+  const ids = allocateIds(data, 'ideas', rows.length);
+
+  data.ideas = data.ideas.concat(
+    rows.map((row, i) => ({ ...row, id: ids[i], created_at: now, updated_at: now }))
+  );
+  saveStorageData(data, ['ideas', 'counters']);
+  return ids;
+}
+
+export function getAllIdeas(): Idea[] {
+  return memoize('allIdeas', ['ideas'], () =>
+    newestFirst(getStorageData().ideas)
+  );
+}
+
+// Apply every list filter in a single pass over the ideas
+export function queryIdeas(filters: IdeaFilters = {}): Idea[] {
+  const { status } = filters;
+  const tags = filters.tags ? parseTags(filters.tags) : [];
+  const keyword = filters.keyword ? filters.keyword.toLowerCase() : null;
+
+  // A single tag narrows straight to its posting list
+  const byTag = tags.length > 0 ? getIdeasByTagIndex() : null;
+  const tagged = byTag ? idsWithAnyTag(byTag, tags) : null;
+  const candidates = byTag && tags.length === 1
+    ? byTag.get(tags[0]) || []
+    : getAllIdeas();
+  const searchText = keyword ? getIdeaSearchIndex() : null;
+
+  return candidates.filter(i =>
+    (!status || i.status === status) &&
+    (!tagged || tagged.has(i.id)) &&
+    (!keyword || (searchText?.get(i.id) || '').includes(keyword))
   );
 }
 
 export function getIdeaById(id: number): Idea | null {
-  const data = getStorageData();
-  return data.ideas.find(i => i.id === id) || null;
+  return getIdeasByIdIndex().get(id) || null;
 }
 
 export function updateIdea(
@@ -214,12 +733,11 @@ export function updateIdea(
   tags: string
 ): boolean {
   const data = getStorageData();
-  const index = data.ideas.findIndex(i => i.id === id);
+  const index = getIdeaPositions().get(id);
 
-  if (index === -1) return false;
+  if (index === undefined) return false;
 
-  data.ideas[index] = {
-    ...data.ideas[index],
+  const changes = {
     title,
     pitch,
     target_user,
@@ -229,113 +747,191 @@ export function updateIdea(
     risks,
     status,
     score,
-    tags,
-    updated_at: new Date().toISOString()
+    tags
   };
+  if (!hasChanges(data.ideas[index], changes)) return true;
 
-  saveStorageData(data);
+  data.ideas[index] = touch(data.ideas[index], changes);
+
+  saveStorageData(data, ['ideas']);
   return true;
 }
 
 export function deleteIdea(id: number): boolean {
-  const data = getStorageData();
-  const originalLen = data.ideas.length;
-  data.ideas = data.ideas.filter(i => i.id !== id);
+  const index = getIdeaPositions().get(id);
+  if (index === undefined) return false;
+
+  // Only rewrite links/notes when something actually references the record
+  const hasLinks = getLinksByIdeaIndex().has(id);
+  const notes = getNotesByIdeaIndex().get(id) || [];
+  const notePositions = getNotePositions();
 
-  if (data.ideas.length < originalLen) {
+  const data = getStorageData();
+  data.ideas.splice(index, 1);
+  const sections: Section[] = ['ideas'];
+  if (hasLinks) {
     // Cascade delete links
     data.links = data.links.filter(l => l.idea_id !== id);
+    sections.push('links');
+  }
+  if (notes.length > 0) {
     // Nullify note references
-    data.notes = data.notes.map(n =>
-      n.idea_id === id ? { ...n, idea_id: null } : n
-    );
-    saveStorageData(data);
-    return true;
+    notes.forEach(n => {
+      data.notes[notePositions.get(n.id) as number] = { ...n, idea_id: null };
+    });
+    sections.push('notes');
   }
-  return false;
+  saveStorageData(data, sections);
+  return true;
 }
 
 export function getIdeasCountByStatus(): Record<string, number> {
-  const data = getStorageData();
-  const counts: Record<string, number> = {};
-  data.ideas.forEach(i => {
-    counts[i.status] = (counts[i.status] || 0) + 1;
+  const counts = memoize('ideaCounts', ['ideas'], () => {
+    const data = getStorageData();
+    const result: Record<string, number> = {};
+    data.ideas.forEach(i => {
+      result[i.status] = (result[i.status] || 0) + 1;
+    });
+    return result;
   });
-  return counts;
+  return { ...counts };
 }
 
-export function getRecentIdeas(limit = 5): Idea[] {
-  return getAllIdeas().slice(0, limit);
+export function getRecentIdeas(limit = 5): IdeaSummary[] {
+  return getAllIdeas()
+    .slice(0, limit)
+    .map(({ id, title, status, score, created_at }) => ({
+      id, title, status, score, created_at
+    }));
 }
 
 // =============================================================================
 // PROBLEM-IDEA LINKS
 // =============================================================================
 
-export function linkProblemToIdea(problem_id: number, idea_id: number): boolean {
-  const data = getStorageData();
+// Whether problem_id and idea_id are linked, from the link index rather than
+// a scan of every link
+function isLinked(problem_id: number, idea_id: number): boolean {
+  return (getLinksByProblemIndex().get(problem_id) || []).indexOf(idea_id) !== -1;
+}
 
-  // Check if link already exists
-  if (data.links.some(l => l.problem_id === problem_id && l.idea_id === idea_id)) {
-    return false;
-  }
+export function linkProblemToIdea(problem_id: number, idea_id: number): boolean {
+  if (isLinked(problem_id, idea_id)) return false;
 
+  const data = getStorageData();
   const id = getNextId(data, 'links');
   data.links.push({ id, problem_id, idea_id });
-  saveStorageData(data);
+  saveStorageData(data, ['links', 'counters']);
   return true;
 }
 
 export function unlinkProblemFromIdea(problem_id: number, idea_id: number): boolean {
+  if (!isLinked(problem_id, idea_id)) return false;
+
   const data = getStorageData();
-  const originalLen = data.links.length;
+  // Vaults written before links were deduplicated can hold the pair more
+  // than once; drop every copy so the pair is really unlinked
   data.links = data.links.filter(l =>
     !(l.problem_id === problem_id && l.idea_id === idea_id)
   );
+  saveStorageData(data, ['links']);
+  return true;
+}
 
-  if (data.links.length < originalLen) {
-    saveStorageData(data);
-    return true;
-  }
-  return false;
+// Records for the given ids through the id and position indexes, so a join
+// costs O(k log k) in the number of links rather than a scan of the whole
+// collection. Keeps stored order and drops duplicate or dangling ids.
+function resolveIds<T>(
+  ids: number[],
+  byId: Map<number, T>,
+  positions: Map<number, number>
+): T[] {
+  return Array.from(new Set(ids))
+    .filter(id => byId.has(id))
+    .sort((a, b) => (positions.get(a) as number) - (positions.get(b) as number))
+    .map(id => byId.get(id) as T);
 }
 
 export function getIdeasForProblem(problem_id: number): Idea[] {
-  const data = getStorageData();
-  const ideaIds = data.links
-    .filter(l => l.problem_id === problem_id)
-    .map(l => l.idea_id);
-  return data.ideas.filter(i => ideaIds.includes(i.id));
+  return resolveIds(
+    getLinksByProblemIndex().get(problem_id) || [],
+    getIdeasByIdIndex(),
+    getIdeaPositions()
+  );
 }
 
 export function getProblemsForIdea(idea_id: number): Problem[] {
-  const data = getStorageData();
-  const problemIds = data.links
-    .filter(l => l.idea_id === idea_id)
-    .map(l => l.problem_id);
-  return data.problems.filter(p => problemIds.includes(p.id));
+  return resolveIds(
+    getLinksByIdeaIndex().get(idea_id) || [],
+    getProblemsByIdIndex(),
+    getProblemPositions()
+  );
 }
 
 export function getLinkedProblemIdsForIdea(idea_id: number): number[] {
-  const data = getStorageData();
-  return data.links
-    .filter(l => l.idea_id === idea_id)
-    .map(l => l.problem_id);
+  return [...(getLinksByIdeaIndex().get(idea_id) || [])];
+}
+
+export function getLinkedIdeaIdsForProblem(problem_id: number): number[] {
+  return [...(getLinksByProblemIndex().get(problem_id) || [])];
 }
 
 export function setProblemLinksForIdea(idea_id: number, problem_ids: number[]): void {
   const data = getStorageData();
+  const desired = new Set(problem_ids);
+  const existing = getLinksByIdeaIndex().get(idea_id) || [];
 
-  // Remove existing links for this idea
-  data.links = data.links.filter(l => l.idea_id !== idea_id);
+  // Only touch the links that actually changed; untouched links keep their ids
+  const toAdd = Array.from(desired).filter(pid => existing.indexOf(pid) === -1);
+  const hasRemovals = existing.some(pid => !desired.has(pid));
+  if (toAdd.length === 0 && !hasRemovals) return;
 
-  // Add new links
-  problem_ids.forEach(problem_id => {
-    const id = getNextId(data, 'links');
-    data.links.push({ id, problem_id, idea_id });
-  });
+  if (hasRemovals) {
+    data.links = data.links.filter(l => l.idea_id !== idea_id || desired.has(l.problem_id));
+  }
+
+  const ids = allocateIds(data, 'links', toAdd.length);
+  const newLinks: ProblemIdeaLink[] = toAdd.map((problem_id, i) => ({
+    id: ids[i],
+    problem_id,
+    idea_id
+  }));
+  data.links = data.links.concat(newLinks);
+
+  saveStorageData(data, toAdd.length > 0 ? ['links', 'counters'] : ['links']);
+}
 
-  saveStorageData(data);
+// Create or update an idea and replace its problem links in one batch, so
+// both sections are written once per save. Pass id null to create. Returns
+// the idea id, or null if the idea to update doesn't exist.
+export function saveIdeaWithLinks(
+  id: number | null,
+  idea: IdeaInput,
+  problem_ids: number[]
+): number | null {
+  const {
+    title, pitch, target_user, value_prop, differentiation,
+    assumptions, risks, status, score, tags
+  } = idea;
+  return batch(() => {
+    let ideaId: number;
+    if (id === null) {
+      ideaId = createIdea(
+        title, pitch, target_user, value_prop, differentiation,
+        assumptions, risks, status, score, tags
+      );
+    } else {
+      if (!updateIdea(
+        id, title, pitch, target_user, value_prop, differentiation,
+        assumptions, risks, status, score, tags
+      )) {
+        return null;
+      }
+      ideaId = id;
+    }
+    setProblemLinksForIdea(ideaId, problem_ids);
+    return ideaId;
+  });
 }
 
 // =============================================================================
@@ -350,7 +946,7 @@ export function createNote(
   idea_id: number | null = null
 ): number {
   const data = getStorageData();
-  const now = new Date().toISOString();
+  const now = timestamp();
   const id = getNextId(data, 'notes');
 
   const note: Note = {
@@ -364,20 +960,51 @@ export function createNote(
   };
 
   data.notes.push(note);
-  saveStorageData(data);
+  saveStorageData(data, ['notes', 'counters']);
   return id;
 }
 
-export function getAllNotes(): Note[] {
+export function createNotesBulk(rows: NoteInput[]): number[] {
+  if (rows.length === 0) return [];
+
   const data = getStorageData();
-  return [...data.notes].sort((a, b) =>
-    new Date(b.created_at).getTime() - new Date(a.created_at).getTime()
+  const now = timestamp();
+  const ids = allocateIds(data, 'notes', rows.length);
+
+  data.notes = data.notes.concat(
+    rows.map((row, i) => ({ ...row, id: ids[i], created_at: now }))
+  );
+  saveStorageData(data, ['notes', 'counters']);
+  return ids;
+}
+
+export function getAllNotes(): Note[] {
+  return memoize('allNotes', ['notes'], () =>
+    newestFirst(getStorageData().notes)
+  );
+}
+
+// Apply every list filter in a single pass, starting from the smallest
+// candidate set the foreign-key indexes can give
+export function queryNotes(filters: NoteFilters = {}): Note[] {
+  const { note_type, problem_id, idea_id } = filters;
+
+  const candidates =
+    problem_id !== undefined
+      ? getNotesByProblemIndex().get(problem_id) || []
+      : idea_id !== undefined
+        ? getNotesByIdeaIndex().get(idea_id) || []
+        : getAllNotes();
+
+  return candidates.filter(n =>
+    (!note_type || n.note_type === note_type) &&
+    (problem_id === undefined || n.problem_id === problem_id) &&
+    (idea_id === undefined || n.idea_id === idea_id)
   );
 }
 
 export function getNoteById(id: number): Note | null {
-  const data = getStorageData();
-  return data.notes.find(n => n.id === id) || null;
+  return getNotesByIdIndex().get(id) || null;
 }
 
 export function updateNote(
@@ -389,47 +1016,93 @@ export function updateNote(
   idea_id: number | null
 ): boolean {
   const data = getStorageData();
-  const index = data.notes.findIndex(n => n.id === id);
+  const index = getNotePositions().get(id);
 
-  if (index === -1) return false;
+  if (index === undefined) return false;
 
-  data.notes[index] = {
-    ...data.notes[index],
+  const changes = {
     note_type,
     content,
     links,
     problem_id,
     idea_id
   };
+  if (!hasChanges(data.notes[index], changes)) return true;
+
+  data.notes[index] = { ...data.notes[index], ...changes };
 
-  saveStorageData(data);
+  saveStorageData(data, ['notes']);
   return true;
 }
 
 export function deleteNote(id: number): boolean {
+  const index = getNotePositions().get(id);
+  if (index === undefined) return false;
+
   const data = getStorageData();
-  const originalLen = data.notes.length;
-  data.notes = data.notes.filter(n => n.id !== id);
+  data.notes.splice(index, 1);
+  saveStorageData(data, ['notes']);
+  return true;
+}
 
-  if (data.notes.length < originalLen) {
-    saveStorageData(data);
-    return true;
-  }
-  return false;
+// Detail-view bundles are memoized per record until the next write, so
+// re-selecting a record doesn't redo the joins. Shared like getAllProblems:
+// callers must copy before mutating.
+export function getProblemBundle(problem_id: number): ProblemBundle | null {
+  return memoize(`problemBundle:${problem_id}`, ['problems', 'ideas', 'notes', 'links'], () => {
+    const problem = getProblemById(problem_id);
+    if (!problem) return null;
+    return {
+      problem,
+      linked_ideas: getIdeasForProblem(problem_id),
+      notes: getNotesForProblem(problem_id)
+    };
+  });
+}
+
+export function getIdeaBundle(idea_id: number): IdeaBundle | null {
+  return memoize(`ideaBundle:${idea_id}`, ['problems', 'ideas', 'notes', 'links'], () => {
+    const idea = getIdeaById(idea_id);
+    if (!idea) return null;
+    return {
+      idea,
+      linked_problems: getProblemsForIdea(idea_id),
+      notes: getNotesForIdea(idea_id)
+    };
+  });
+}
+
+export function getNotesCount(): number {
+  return getStorageData().notes.length;
 }
 
 export function getNotesForProblem(problem_id: number): Note[] {
-  const data = getStorageData();
-  return data.notes
-    .filter(n => n.problem_id === problem_id)
-    .sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime());
+  return [...(getNotesByProblemIndex().get(problem_id) || [])];
 }
 
 export function getNotesForIdea(idea_id: number): Note[] {
-  const data = getStorageData();
-  return data.notes
-    .filter(n => n.idea_id === idea_id)
-    .sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime());
+  return [...(getNotesByIdeaIndex().get(idea_id) || [])];
+}
+
+// =============================================================================
+// STATS
+// =============================================================================
+
+export function getDashboardStats(): DashboardStats {
+  return {
+    problems: getProblemsCountByStatus(),
+    ideas: getIdeasCountByStatus(),
+    notes_total: getNotesCount()
+  };
+}
+
+// Everything the Dashboard page renders, in one call
+export function getDashboardData(limit = 5): DashboardData {
+  return {
+    ...getDashboardStats(),
+    recent_problems: getRecentProblems(limit),
+    recent_ideas: getRecentIdeas(limit)
+  };
 }
 
 // =============================================================================
@@ -442,7 +1115,7 @@ export function exportAllData(): StorageData {
 
 export function importAllData(data: StorageData): boolean {
   try {
-    saveStorageData(data);
+    saveStorageData({ ...emptyData(), ...data }, SECTIONS);
     return true;
   } catch {
     return false;
@@ -450,12 +1123,5 @@ export function importAllData(data: StorageData): boolean {
 }
 
 export function clearAllData(): void {
-  const initial: StorageData = {
-    problems: [],
-    ideas: [],
-    notes: [],
-    links: [],
-    counters: { problems: 0, ideas: 0, notes: 0, links: 0 }
-  };
-  saveStorageData(initial);
+  saveStorageData(emptyData(), SECTIONS);
 }
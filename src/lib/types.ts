@@ -27,6 +27,42 @@ export interface Idea {
   updated_at: string;
 }
 
+// Criteria for queryProblems; omitted fields don't filter
+export interface ProblemFilters {
+  status?: Problem['status'];
+  severity?: number;
+  // Comma-separated, as typed in the filter box
+  tags?: string;
+  keyword?: string;
+}
+
+// Criteria for queryIdeas; omitted fields don't filter
+export interface IdeaFilters {
+  status?: Idea['status'];
+  // Comma-separated, as typed in the filter box
+  tags?: string;
+  keyword?: string;
+}
+
+// Criteria for queryNotes; omitted fields don't filter
+export interface NoteFilters {
+  note_type?: Note['note_type'];
+  problem_id?: number;
+  idea_id?: number;
+}
+
+// Caller-supplied fields for bulk creates; ids and timestamps are assigned
+export type ProblemInput = Omit<Problem, 'id' | 'created_at' | 'updated_at'>;
+
+export type IdeaInput = Omit<Idea, 'id' | 'created_at' | 'updated_at'>;
+
+export type NoteInput = Omit<Note, 'id' | 'created_at'>;
+
+// Fields shown in the dashboard's "Recently Added" tables
+export type ProblemSummary = Pick<Problem, 'id' | 'title' | 'status' | 'severity' | 'created_at'>;
+
+export type IdeaSummary = Pick<Idea, 'id' | 'title' | 'status' | 'score' | 'created_at'>;
+
 export interface Note {
   id: number;
   note_type: 'interview' | 'competitor' | 'pricing' | 'tech' | 'general';
@@ -43,6 +79,20 @@ export interface ProblemIdeaLink {
   idea_id: number;
 }
 
+// A problem with everything its detail view shows
+export interface ProblemBundle {
+  problem: Problem;
+  linked_ideas: Idea[];
+  notes: Note[];
+}
+
+// An idea with everything its detail view shows
+export interface IdeaBundle {
+  idea: Idea;
+  linked_problems: Problem[];
+  notes: Note[];
+}
+
 export interface StorageData {
   problems: Problem[];
   ideas: Idea[];
@@ -55,3 +105,14 @@ export interface StorageData {
     links: number;
   };
 }
+
+export interface DashboardStats {
+  problems: Record<string, number>;
+  ideas: Record<string, number>;
+  notes_total: number;
+}
+
+export interface DashboardData extends DashboardStats {
+  recent_problems: ProblemSummary[];
+  recent_ideas: IdeaSummary[];
+}